@@ -1,16 +1,30 @@
 from flask import Flask, render_template, request, session
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from dotenv import load_dotenv
 
 load_dotenv() # Load environment variables from .env file
 
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+# Read from the environment so every worker process signs session cookies with the same key
+app.secret_key = os.getenv('SECRET_KEY')
+if not app.secret_key:
+    app.secret_key = os.urandom(24)
+    app.logger.warning("SECRET_KEY is not set; using a random key, so sessions won't survive restarts "
+                       "or be shared across workers")
 
 # Load API key from environment variable
 API_KEY = os.getenv('STEAM_API_KEY')
 
+# Shared session so calls to the Steam API reuse pooled keep-alive connections
+steam_session = requests.Session()
+adapter = HTTPAdapter(pool_connections=50, pool_maxsize=200,
+                      max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]))
+steam_session.mount('http://', adapter)
+steam_session.mount('https://', adapter)
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'POST':
@@ -37,12 +51,14 @@ def get_user_games(steam_id):
         return None
     url = f'http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={API_KEY}&steamid={steam_id}&format=json&include_appinfo=1'
     try:
-        response = requests.get(url)
+        response = steam_session.get(url, timeout=(2, 5))
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data from Steam API: {e}")
         return None
 
+# Development server only; in production serve the app with a WSGI server instead (SECRET_KEY must be set), e.g.
+# gunicorn -w 4 -k gthread --threads 2 -b 0.0.0.0:5000 flask_app:app
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1')
@@ -3,32 +3,66 @@ __version__ = "0.1"
 import sys
 import os
 import re
-import requests
-import json
-import time
+import html
+import asyncio
+import aiohttp
+import ijson
+import orjson
+import hashlib
+import pickle
+import tempfile
 import traceback
-from random import shuffle
-import pymysql
+from random import shuffle, uniform
+import MySQLdb
+import MySQLdb.cursors
 import datetime as dt
 import logging
 import argparse
 import shutil
-from copy import deepcopy
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import yaml
+from aiolimiter import AsyncLimiter
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional, List
+from urllib.parse import urlsplit
 
 CONFIG_FILE = 'config.yaml'
 ENDPOINT_FILE = 'end_points.yaml'
 CONFIG = {}
 ENDPOINTS = {}
+YAML_CACHE_DIR = '.yaml_cache'
+# Prefer libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Load a YAML file, reusing a pickled copy of it for as long as the file's mtime is unchanged
+def _load_yaml_cached(path: str) -> Any:
+    mtime = os.stat(path).st_mtime_ns
+    path_hash = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(YAML_CACHE_DIR, f"{path_hash}-{mtime}.pkl")
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+    os.makedirs(YAML_CACHE_DIR, exist_ok=True)
+    # Drop pickles of older versions of this file before writing the new one
+    for filename in os.listdir(YAML_CACHE_DIR):
+        if filename.startswith(f"{path_hash}-"):
+            os.remove(os.path.join(YAML_CACHE_DIR, filename))
+    with open(cache_file, 'wb') as f:
+        pickle.dump(data, f)
+    return data
 
 # Load configuration from config.yaml into global CONFIG
 def load_config_file():
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            global CONFIG
-            CONFIG = yaml.safe_load(f)
+        global CONFIG
+        CONFIG = _load_yaml_cached(CONFIG_FILE)
     except FileNotFoundError:
         logging.error(f"{CONFIG_FILE} not found")
         raise
@@ -39,9 +73,8 @@ def load_config_file():
 # Load endpoint definitions from end_points.yaml into global ENDPOINTS
 def load_endpoints_file():
     try:
-        with open(ENDPOINT_FILE, 'r', encoding='utf-8') as f:
-            global ENDPOINTS
-            ENDPOINTS = yaml.safe_load(f)
+        global ENDPOINTS
+        ENDPOINTS = _load_yaml_cached(ENDPOINT_FILE)
     except FileNotFoundError:
         logging.error(f"{ENDPOINT_FILE} not found")
         raise
@@ -50,7 +83,28 @@ def load_endpoints_file():
         raise
 
 load_dotenv()
-APPLIST_CACHE_FILE = 'applist.json'
+APPLIST_CACHE_FILE = 'applist.txt'
+# MySQL error raised by a migration whose column already exists
+ER_DUP_FIELDNAME = 1060
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Request failures _do_requests re-raises once retries run out; fetch_app records them per app
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+# Upper bound in bytes on each multi-row INSERT that executemany builds, well under max_allowed_packet
+MAX_STMT_LENGTH = 1024 * 1024
+# Splits "INSERT ... VALUES (%s, ...) [ON DUPLICATE ...]" around its single row of placeholders
+INSERT_VALUES_RE = re.compile(r'^(.*?\bVALUES\s*)(\([^)]*\))(.*)$', re.IGNORECASE | re.DOTALL)
+# Patterns and tables used by the per-app text helpers, built once at import
+TAG_RE = re.compile(r'<[^>]*>')
+ORDINAL_RE = re.compile(r'(\d+)(?:st|nd|rd|th)')
+# Steam release dates come as "21 Aug 2012" or "Aug 21 2012" once commas and ordinals are removed
+STEAM_DATE_RE = re.compile(r'^\s*(?:(\d{1,2})\s+([A-Za-z]{3})|([A-Za-z]{3})\s+(\d{1,2}))\s+(\d{4})\s*$')
+MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+PRICE_RE = re.compile(r'([0-9]+\.?[0-9]*)')
+WHITESPACE_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+# Escapes for LOAD DATA's default tab-separated format (NULL is written as \N)
+LOAD_DATA_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
 
 # Move old log files to .old_logs directory and return new log filename
 def manage_log_files():
@@ -83,61 +137,118 @@ class SteamAPI:
     def __init__(self, steam_api_config: dict, scraper_settings: dict) -> None:
         self.config = steam_api_config
         self.settings = scraper_settings
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': f'SteamScraper/{__version__}'})
+        self.session: Optional[aiohttp.ClientSession] = None
+        # One limiter per host, so a slow endpoint never throttles the others
+        self.limiters = {host: AsyncLimiter(limit['max_rate'], limit['period'])
+            for host, limit in scraper_settings['rate_limits'].items()}
         logging.info("SteamAPI initialized")
 
-    # Internal method to perform GET requests with error handling
-    def _do_requests(self, url: str, params: Optional[dict] = None) -> dict:
-        try:
-            response = self.session.get(url, params = params, timeout = self.settings['timeout'])
-            response.raise_for_status()
-            logging.info(f"Request SteamAPI successful: {response.status_code}")
-            return response.json() if response.text else {}
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Request failed: {e}")
-            return {}
-
-    # Get all Steam app IDs, using cache if available
-    def get_all_app_ids(self)-> List[str]:
+    # Open the shared HTTP session; must be entered from inside the running event loop
+    async def __aenter__(self) -> "SteamAPI":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=60),
+            headers={'User-Agent': f'SteamScraper/{__version__}'},
+            timeout=aiohttp.ClientTimeout(total=self.settings['timeout']))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    # Internal method to perform GET requests; transient failures are retried with exponential backoff
+    async def _do_requests(self, url: str, params: Optional[dict] = None) -> dict:
+        limiter = self.limiters.get(urlsplit(url).hostname)
+        retries = self.settings['retries']
+        for attempt in range(retries + 1):
+            if limiter:
+                await limiter.acquire()
+            try:
+                async with self.session.get(url, params = params) as response:
+                    response.raise_for_status()
+                    # orjson parses the raw bytes, skipping the decode to str
+                    body = await response.read()
+                logging.info(f"Request SteamAPI successful: {response.status}")
+                return orjson.loads(body) if body else {}
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES:
+                    logging.error(f"Request failed: {e}")
+                    return {}
+                error = e
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                error = e
+            except ValueError as e:
+                logging.error(f"Request failed: {e}")
+                return {}
+            # Give up loudly rather than recording the app as unavailable; fetch_app records it as an error
+            if attempt == retries:
+                logging.error(f"Request failed after {retries} retries: {error!r}")
+                raise error
+            # Jitter keeps concurrent workers that failed together from retrying in lockstep
+            delay = self.settings['backoff_factor'] * 2 ** attempt + uniform(0, self.settings['jitter'])
+            logging.warning(f"Request failed ({error!r}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    # Get all Steam app IDs, using cache (one ID per line) if available
+    async def get_all_app_ids(self)-> List[str]:
         if os.path.exists(APPLIST_CACHE_FILE):
             logging.info(f"Loading Applist from Cache: {APPLIST_CACHE_FILE}")
             with open(APPLIST_CACHE_FILE, 'r', encoding = 'utf-8') as f:
-                return json.load(f)
+                return [line.rstrip('\n') for line in f]
         logging.info("Requesting full app list from Steam API")
-        app_list_data = self._do_requests(ENDPOINTS["STEAM"]["GET_APP_LIST"])
-        app_ids = [str(data['appid']) for data in app_list_data['applist']['apps']]
-        logging.info(f"Saying {len(app_ids)} app IDS to cache for future runs.")
-        with open(APPLIST_CACHE_FILE, 'w', encoding = 'utf-8') as f:
-            json.dump(app_ids, f)
+        url = ENDPOINTS["STEAM"]["GET_APP_LIST"]
+        limiter = self.limiters.get(urlsplit(url).hostname)
+        partial_file = f"{APPLIST_CACHE_FILE}.part"
+        app_ids = []
+        try:
+            if limiter:
+                await limiter.acquire()
+            # The list is several MB, so only bound the gaps between reads, not the whole download
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=self.settings['timeout'])
+            async with self.session.get(url, timeout = timeout) as response:
+                response.raise_for_status()
+                with open(partial_file, 'w', encoding = 'utf-8') as f:
+                    # Parse IDs as the body streams in instead of materialising the whole JSON document
+                    async for appid in ijson.items(response.content, 'applist.apps.item.appid'):
+                        app_id = str(appid)
+                        app_ids.append(app_id)
+                        f.write(f"{app_id}\n")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ijson.JSONError) as e:
+            logging.error(f"Request failed: {e}")
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+            return []
+        os.replace(partial_file, APPLIST_CACHE_FILE)
+        logging.info(f"Saved {len(app_ids)} app IDS to cache for future runs.")
         return app_ids
 
     # Get details for a specific app ID
-    def get_app_details(self, appid: str) -> Optional[dict]:
+    async def get_app_details(self, appid: str) -> Optional[dict]:
         params = {"appids": appid, "cc": self.config['currency'], "l":self.config['language']}
-        data = self._do_requests(f"{ENDPOINTS['STEAM']['GET_APP_DETAILS']}", params)
+        data = await self._do_requests(f"{ENDPOINTS['STEAM']['GET_APP_DETAILS']}", params)
         if not data:
             return None
         return data[appid]['data'] if data[appid]['success'] else None
 
     # Get additional details from SteamSpy for a game
-    def get_steamspy_details(self, appid: str) -> Optional[dict]:
-        data = self._do_requests(f"https://steamspy.com/api.php?request=appdetails&appid={appid}")
+    async def get_steamspy_details(self, appid: str) -> Optional[dict]:
+        data = await self._do_requests(f"https://steamspy.com/api.php?request=appdetails&appid={appid}")
         return data if data and data.get('developer') else None
 
     # Get achievements for a specific app ID
-    def get_achievements(self, appid: str) -> list:
+    async def get_achievements(self, appid: str) -> list:
         try:
-            schema_data = self._do_requests(
-                ENDPOINTS['STEAM']['GET_SCHEMA_FOR_GAME'],
-                params={'key': os.getenv('STEAM_API_KEY'), 'appid': appid, 'l': self.config['language']})
+            # The schema and the completion percentages are independent, so fetch both at once
+            schema_data, percent_data = await asyncio.gather(
+                self._do_requests(
+                    ENDPOINTS['STEAM']['GET_SCHEMA_FOR_GAME'],
+                    params={'key': os.getenv('STEAM_API_KEY'), 'appid': appid, 'l': self.config['language']}),
+                self._do_requests(ENDPOINTS['STEAM']['GET_GLOBAL_STATS'], params={'gameid': appid}))
             if not schema_data or 'game' not in schema_data or 'availableGameStats' not in schema_data['game']:
                 return []
             achievements = schema_data['game']['availableGameStats'].get('achievements', [])
             if achievements == []:
                 return []
-            percent_data = self._do_requests("http://api.steampowered.com/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v2/",
-                params={'gameid': appid})
             # Map achievement names to their global completion percentages
             percentages = {item['name']: item['percent']
                 for item in percent_data.get('achievementpercentages', {}).get('achievements', [])} if percent_data else {}
@@ -145,15 +256,16 @@ class SteamAPI:
                 "display_name": a.get('displayName'), "description": a.get('description'),
                 "global_completion_rate": round(float(percentages.get(a['name'], 0.0)), 4)} for a in achievements]
         except Exception as e:
-            print(f"Error fetching achievements for appid {appid}: {e}")
+            logging.error(f"Error fetching achievements for appid {appid}: {e}")
             raise e
 
     # Get user reviews for a specific app ID
-    def get_reviews(self, appid: str) -> list:
+    async def get_reviews(self, appid: str) -> list:
+        # aiohttp only accepts str/int/float query values, so flags are sent as 1
         params = {'json': 1, 'num_per_page': 20,
-            'language': 'english', 'filter_offtopic_activity': True,
-            'filter_user_generated_content': True}
-        data = self._do_requests(ENDPOINTS['STEAM']['GET_USER_REVIEW'] + f"{appid}", params)
+            'language': 'english', 'filter_offtopic_activity': 1,
+            'filter_user_generated_content': 1}
+        data = await self._do_requests(ENDPOINTS['STEAM']['GET_USER_REVIEW'] + f"{appid}", params)
         if data.get("reviews", []) == []:
             return []
         reviews = data["reviews"] if data["reviews"] and data.get('success') == 1 else []
@@ -166,17 +278,53 @@ class DatabaseManager:
     """
     Handles all database operations, including table creation and data insertion.
     """
-    def __init__(self, db_creds: dict, schema_yaml_path: str = "schema.yaml"):
+    def __init__(self, db_creds: dict, schema_yaml_path: str = "schema.yaml", batch_size: int = 50,
+            bulk_load_min_rows: int = 500):
         self.schema = self._load_schema(schema_yaml_path)
+        self.batch_size = batch_size
+        # Buffers at least this large are bulk loaded; disabled if the server refuses LOCAL INFILE
+        self.bulk_load_min_rows = bulk_load_min_rows
+        self._bulk_load_enabled = True
+        # Rows waiting for the next flush, keyed by table, and how many apps they cover
+        self._buffers = defaultdict(list)
+        self._pending_apps = 0
+        # Set once a batch fails to write; nothing is flushed after that
+        self._flush_failed = False
+        queries = self.schema['queries']
+        junction_queries = queries['junction_tables']
+        self._insert_sql = insert_sql = {
+            'apps': queries['apps']['insert_update'],
+            'achievements': queries['achievements']['insert_update'],
+            'reviews': queries['reviews']['insert_update'],
+            'app_reviews': junction_queries['insert_reviews'],
+            'app_supported_languages': junction_queries['insert_language'],
+            'app_tags': junction_queries['insert_tag'],
+            'pending_dlc_links': junction_queries['add_pending_dlc'],
+            'scrape_status': queries['scrape_status']['mark_processed'],
+            '_applist': queries['applist']['insert'],
+            **{f'app_{item_type}': junction_queries['insert_ignore'].format(table=f'app_{item_type}')
+                for item_type in ['developers', 'publishers', 'categories', 'genres']}
+        }
+        # (head, row placeholders, tail) of every buffered insert, used to build the bulk-load upserts
+        self._insert_parts = {table: INSERT_VALUES_RE.match(sql).groups() for table, sql in insert_sql.items()}
+        # SQL and table names used per app, formatted once here instead of on every call
+        self._sql_upsert_id = {table: queries['lookup_tables']['upsert_id'].format(table=table)
+            for table in queries['lookup_tables']['names']}
+        self._relation_tables = [(item_type, f'app_{item_type}')
+            for item_type in ['developers', 'publishers', 'categories', 'genres']]
+        self._bulk_load_tables = set(queries['bulk_load']['tables'])
         load_dotenv()
         try:
-            self.connection = pymysql.connect(
+            self.connection = MySQLdb.connect(
                 host=db_creds['host'], user=db_creds['user'], password=db_creds['password'],
-                database=db_creds['database'], cursorclass=pymysql.cursors.DictCursor, charset='utf8mb4'
+                database=db_creds['database'], cursorclass=MySQLdb.cursors.DictCursor, charset='utf8mb4',
+                local_infile=1
             )
             self.cursor = self.connection.cursor()
+            self.cursor.max_stmt_length = MAX_STMT_LENGTH
             self._creates_tables()
-        except pymysql.Error as e:
+            self._lookup_cache = self._load_lookup_cache()
+        except MySQLdb.Error as e:
             logging.error(f"Database connection failed: {e}")
             sys.exit(1)
 
@@ -184,9 +332,7 @@ class DatabaseManager:
     def _load_schema(self, schema_yaml_path: str) -> dict:
         if schema_yaml_path:
             try:
-                with open(schema_yaml_path, 'r') as file:
-                    schema = yaml.safe_load(file)
-                return schema
+                return _load_yaml_cached(schema_yaml_path)
             except yaml.YAMLError as e:
                 logging.error("Error Parsing YAML: ", e)
                 raise
@@ -197,13 +343,32 @@ class DatabaseManager:
             logging.error("No schema file provided")
             raise
 
-    # Get all app IDs that have already been processed
-    def get_all_processed_app_ids(self) -> set:
-        logging.info("Fetching all processed app IDs...")
-        self.cursor.execute(self.schema['queries']['scrape_status']['all_prcoessed'])
-        processed_ids = {row['appid'] for row in self.cursor.fetchall()}
-        logging.info(f"Found {len(processed_ids)} processed app IDs")
-        return processed_ids
+    # Get the app IDs from the given list with no scrape_status row, or only an error one, diffing them in the database
+    def get_unprocessed_app_ids(self, app_ids: List[str]) -> List[str]:
+        logging.info("Finding app IDs that have not been processed yet...")
+        queries = self.schema['queries']['applist']
+        rows = [(int(appid),) for appid in app_ids]
+        self.cursor.execute(queries['drop_temp'])
+        self.cursor.execute(queries['create_temp'])
+        loaded = False
+        if self._bulk_load_enabled:
+            path = self._write_load_data_file(rows)
+            try:
+                load_sql = self.schema['queries']['bulk_load']['load_stage'].format(stage='_applist', columns='appid')
+                self.cursor.execute(load_sql, (path,))
+                loaded = True
+            except MySQLdb.Error as e:
+                logging.warning(f"Bulk load of the app list failed, falling back to INSERTs from now on: {e}")
+                self._bulk_load_enabled = False
+            finally:
+                os.remove(path)
+        if not loaded:
+            self._insert_rows('_applist', rows)
+        self.cursor.execute(queries['select_unprocessed'])
+        unprocessed = [str(row['appid']) for row in self.cursor.fetchall()]
+        self.cursor.execute(queries['drop_temp'])
+        logging.info(f"Found {len(unprocessed)} unprocessed app IDs")
+        return unprocessed
 
     # Drop all tables in the database (used for reset)
     def _drop_all_tables(self):
@@ -215,7 +380,7 @@ class DatabaseManager:
                 logging.info(f"Dropping table: {table_name}...")
                 self.cursor.execute(f"DROP TABLE IF EXISTS {table_name};")
             logging.info("All tables dropped successfully.")
-        except pymysql.Error as err:
+        except MySQLdb.Error as err:
             logging.error(f"An error occurred while dropping tables: {err}")
         finally:
             # Always re-enable foreign key checks.
@@ -227,55 +392,67 @@ class DatabaseManager:
         for table_name in self.schema['create_order']:
             try:
                 self.cursor.execute(self.schema['tables'][table_name])
-            except pymysql.Error as e:
+            except MySQLdb.Error as e:
                 logging.error(f"An error occurred while creating table {table_name}: {e}")
                 raise
             except Exception as e:
                 logging.error(f"An unexpected error occurred while creating table {table_name}: {e}")
                 raise
+        for migration in self.schema.get('migrations', []):
+            try:
+                self.cursor.execute(migration)
+            except MySQLdb.OperationalError as e:
+                if e.args[0] != ER_DUP_FIELDNAME:
+                    logging.error(f"An error occurred while applying migration '{migration}': {e}")
+                    raise
         self.connection.commit()
 
-    # Check if an app ID has already been processed
-    def is_processed(self, app_id: int) -> bool:
-        try:
-            self.cursor.execute(self.schema['queries']['scrape_status']['is_processed'], (app_id, ))
-            return self.cursor.fetchone() is not None
-        except pymysql.Error as e:
-            logging.error(f"An error occurred while checking processing status for app_id {app_id}: {e}")
-            raise
-        except Exception as e:
-            logging.error(f"An unexpected error occurred while checking processing status for app_id {app_id}: {e}")
-            raise
-
     # Get the count of processed apps
     def get_processed_count(self) -> int:
         self.cursor.execute("SELECT COUNT(1) as count FROM scrape_status")
         result = self.cursor.fetchone()
         return result['count'] if result else 0
 
-    # Mark an app as processed with a given status
-    def mark_as_processed(self, appid: int, status: str):
-        self.cursor.execute(self.schema['queries']['scrape_status']['mark_processed'], (appid, status))
-
-    # Insert a name into a lookup table if not exists, and return its ID
+    # Mark an app as processed with a given status and Steam type; this closes the app, so flush once a batch is full
+    def mark_as_processed(self, appid: int, status: str, app_type: Optional[str] = None):
+        self._buffers['scrape_status'].append((appid, status, app_type))
+        self._pending_apps += 1
+        if self._pending_apps >= self.batch_size:
+            self.flush()
+
+    # Prefetch every lookup table into {table: {name: id}} so known names never hit the database
+    def _load_lookup_cache(self) -> Dict[str, Dict[str, int]]:
+        sql_select = self.schema['queries']['lookup_tables']['select_all']
+        lookup_cache = {}
+        for table in self.schema['queries']['lookup_tables']['names']:
+            self.cursor.execute(sql_select.format(table=table))
+            lookup_cache[table] = {row['name']: row['id'] for row in self.cursor.fetchall()}
+        logging.info(f"Cached {sum(len(ids) for ids in lookup_cache.values())} lookup table names")
+        return lookup_cache
+
+    # Return the ID of a name in a lookup table, inserting it on first sight
     def _get_or_create_id(self, table: str, name: str) -> int:
-        sql_insert = self.schema['queries']['lookup_tables']['insert_ignore'].format(table=table)
-        sql_select = self.schema['queries']['lookup_tables']['select_id'].format(table=table)
-        self.cursor.execute(sql_insert, (name,))
-        self.cursor.execute(sql_select, (name,))
-        result = self.cursor.fetchone()
-        return result['id'] if result else -1
+        table_cache = self._lookup_cache[table]
+        item_id = table_cache.get(name)
+        if item_id is None:
+            cursor = self.cursor
+            cursor.execute(self._sql_upsert_id[table], (name,))
+            if not cursor.lastrowid:
+                return -1
+            item_id = table_cache[name] = cursor.lastrowid
+        return item_id
 
     # Add a pending DLC link to be resolved later
     def add_pending_dlc_link(self, dlc_id: int, base_game_id: int):
         logging.info(f"Adding pending DLC link for DLC ID {dlc_id} and base game ID {base_game_id}")
-        sql = self.schema['queries']['junction_tables']['add_pending_dlc']
-        self.cursor.execute(sql, (dlc_id, base_game_id))
+        self._buffers['pending_dlc_links'].append((dlc_id, base_game_id))
 
     # Resolve all pending DLC links in the database
     def resolve_pending_dlc_links(self):
         logging.info("Attempting to resolve pending DLC links")
         try:
+            if not self._flush_failed:
+                self.flush()
             sql_resolve = self.schema['queries']['utility_queries']['resolve_dlc_links']
             self.cursor.execute(sql_resolve)
             resolved_count = self.cursor.rowcount
@@ -291,59 +468,123 @@ class DatabaseManager:
 
     # Add app and its relations (developers, publishers, etc.) to the database
     def add_app_and_relations(self, parsed_data: Dict[str, Any]):
-        self.cursor.execute(self.schema['queries']['apps']['insert_update'], parsed_data['main_tuple'])
-        app_id = parsed_data['main_tuple'][0]
-        for item_type in ['developers', 'publishers', 'categories', 'genres']:
-            sql_link = self.schema['queries']['junction_tables']['insert_ignore'].format(table=f'app_{item_type}')
+        buffers, get_id = self._buffers, self._get_or_create_id
+        main_tuple = parsed_data['main_tuple']
+        buffers['apps'].append(main_tuple)
+        app_id = main_tuple[0]
+        for item_type, link_table in self._relation_tables:
+            link_rows = buffers[link_table]
             for name in parsed_data.get(item_type, []):
-                item_id = self._get_or_create_id(item_type, name)
+                item_id = get_id(item_type, name)
                 if item_id != -1:
-                    self.cursor.execute(sql_link, (app_id, item_id))
+                    link_rows.append((app_id, item_id))
 
-        sql_link_lang = self.schema['queries']['junction_tables']['insert_language']
+        language_rows = buffers['app_supported_languages']
+        full_audio_languages = set(parsed_data.get('full_audio_languages', []))
         for lang_name in parsed_data.get('supported_languages', []):
-            is_audio = lang_name in parsed_data['main_dict'].get('full_audio_languages', [])
-            lang_id = self._get_or_create_id('languages', lang_name)
+            lang_id = get_id('languages', lang_name)
             if lang_id != -1:
-                self.cursor.execute(sql_link_lang, (app_id, lang_id, is_audio))
-
-        sql_link_tag = self.schema['queries']['junction_tables']['insert_tag']
-        # If tags are a list, print them (debug), otherwise process as dict
-        if isinstance(parsed_data.get('tags', {}), list):
-            print(parsed_data.get('tags', {}))
-        for tag_name, tag_value in ({} if isinstance(parsed_data.get('tags', {}), list) else parsed_data.get('tags', {})).items():
-            tag_id = self._get_or_create_id('tags', tag_name)
+                language_rows.append((app_id, lang_id, lang_name in full_audio_languages))
+
+        # SteamSpy sends an empty list instead of a dict when an app has no tags
+        tags = parsed_data.get('tags', {})
+        if isinstance(tags, list):
+            logging.debug(f"Tags for app {app_id} came back as a list: {tags}")
+            tags = {}
+        tag_rows = buffers['app_tags']
+        for tag_name, tag_value in tags.items():
+            tag_id = get_id('tags', tag_name)
             if tag_id != -1:
-                self.cursor.execute(sql_link_tag, (app_id, tag_id, tag_value))
+                tag_rows.append((app_id, tag_id, tag_value))
 
     # Add achievements for an app to the database
     def add_achievements(self, achievements: list):
         if achievements == []:
             return
-        sql = self.schema['queries']['achievements']['insert_update']
-        data = [(a['app_id'], a['api_name'], a['display_name'],
-            a['description'], a['global_completion_rate']) for a in achievements]
-        self.cursor.executemany(sql, data)
+        self._buffers['achievements'].extend((a['app_id'], a['api_name'], a['display_name'],
+            a['description'], a['global_completion_rate']) for a in achievements)
 
     # Add reviews for an app to the database
     def add_reviews(self, reviews: list, app_id: str):
         if reviews == []:
             return
-        sql_insert_review = self.schema['queries']['reviews']['insert_update']
-        sql_link_review = self.schema['queries']['junction_tables']['insert_reviews']
-        review_tuples, link_tuples = [], []
+        review_rows, link_rows = self._buffers['reviews'], self._buffers['app_reviews']
 
         for r in reviews:
-            review_tuples.append((
+            review_rows.append((
                 r['recommendationid'], r.get('author', {}).get('steamid'), r.get('language'),
                 SteamScraperApplication.sanitize_text(r.get('review')), r.get('voted_up'),
                 r.get('votes_up'), r.get('votes_funny'), dt.datetime.fromtimestamp(r.get('timestamp_created'))
             ))
-            link_tuples.append((app_id, r['recommendationid']))
-        if review_tuples:
-            self.cursor.executemany(sql_insert_review, review_tuples)
-        if link_tuples:
-            self.cursor.executemany(sql_link_review, link_tuples)
+            link_rows.append((app_id, r['recommendationid']))
+
+    # Write every buffered row as multi-row INSERTs (parents before children) and commit the batch
+    # A batch is committed only once every table is written; on failure it is rolled back and dropped, so its apps
+    # stay out of scrape_status and the next run retries them
+    def flush(self):
+        buffers, pending_apps = self._buffers, self._pending_apps
+        self._buffers, self._pending_apps = defaultdict(list), 0
+        try:
+            for table in self.schema['create_order']:
+                rows = buffers.get(table)
+                if not rows:
+                    continue
+                if (self._bulk_load_enabled and len(rows) >= self.bulk_load_min_rows
+                        and table in self._bulk_load_tables):
+                    self._bulk_load(table, rows)
+                else:
+                    self._insert_rows(table, rows)
+            self.commit()
+        except Exception:
+            logging.error(f"Writing a batch of {pending_apps} apps failed, rolling it back")
+            self._flush_failed = True
+            try:
+                self.connection.rollback()
+                # Lookup names inserted during the batch were rolled back too, so their cached IDs are stale
+                self._lookup_cache = self._load_lookup_cache()
+            except MySQLdb.Error as e:
+                logging.error(f"Rollback failed: {e}")
+            raise
+
+    # Insert rows into a table; executemany folds them into multi-row INSERTs of up to max_stmt_length bytes
+    def _insert_rows(self, table: str, rows: list):
+        self.cursor.executemany(self._insert_sql[table], rows)
+
+    # Stream rows through LOAD DATA LOCAL INFILE into a staging table, then upsert them with the table's usual
+    # ON DUPLICATE KEY clause (a REPLACE load would cascade-delete child rows such as app_reviews)
+    def _bulk_load(self, table: str, rows: list):
+        queries = self.schema['queries']['bulk_load']
+        head, _, tail = self._insert_parts[table]
+        columns = head[head.index('(') + 1:head.index(')')]
+        stage = f"_stage_{table}"
+        path = self._write_load_data_file(rows)
+        try:
+            self.cursor.execute(queries['create_stage'].format(stage=stage, table=table))
+            self.cursor.execute(queries['load_stage'].format(stage=stage, columns=columns), (path,))
+            self.cursor.execute(head[:head.upper().rindex('VALUES')] + f"SELECT {columns} FROM {stage}" + tail)
+            self.cursor.execute(queries['clear_stage'].format(stage=stage))
+        except MySQLdb.Error as e:
+            logging.warning(f"Bulk load into {table} failed, falling back to INSERTs from now on: {e}")
+            self._bulk_load_enabled = False
+            self._insert_rows(table, rows)
+        finally:
+            os.remove(path)
+
+    # Write rows to a temporary file in LOAD DATA's tab-separated format and return its path
+    def _write_load_data_file(self, rows: list) -> str:
+        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', newline='', suffix='.tsv', delete=False) as f:
+            for row in rows:
+                f.write('\t'.join(self._to_load_data_field(value) for value in row) + '\n')
+        return f.name
+
+    # Format a value as a LOAD DATA field
+    @staticmethod
+    def _to_load_data_field(value: Any) -> str:
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        return str(value).translate(LOAD_DATA_ESCAPES)
 
     # Commit changes to the database
     def commit(self):
@@ -352,7 +593,8 @@ class DatabaseManager:
     # Close the database connection
     def close(self):
         if self.connection and self.connection.open:
-            self.connection.commit()
+            if not self._flush_failed:
+                self.flush()
             self.cursor.close()
             self.connection.close()
             logging.info("Database connection closed")
@@ -364,8 +606,11 @@ class SteamScraperApplication:
     def __init__(self):
         self.args = self._setup_arg_parser()
         db_creds, steam_api_key = self._load_and_validate_credentials()
-        self.db = DatabaseManager(db_creds)
+        self.db = DatabaseManager(db_creds, batch_size=CONFIG['scraper_settings']['batch_size'],
+            bulk_load_min_rows=CONFIG['scraper_settings']['bulk_load_min_rows'])
         self.steam_api = SteamAPI(CONFIG['steam_api'], CONFIG['scraper_settings'])
+        # A single thread owns all database writes during the scrape, keeping them off the event loop
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
 
         # self.igdb_api = IGDB_API(CONFIG['scraper_settings'])
 
@@ -390,87 +635,143 @@ class SteamScraperApplication:
     def run(self): # type: ignore
         logging.info(f"Steam Scraper {__version__} starting.")
 
-        app_ids = self.steam_api.get_all_app_ids()
+        app_ids = asyncio.run(self._fetch_app_list())
         if not app_ids:
             logging.error("Could not retrieve app list, Exiting. ")
             sys.exit(1)
 
         # Remove already processed app IDs from the list
         processed_in_db = self.db.get_processed_count()
-        processed_id_set = self.db.get_all_processed_app_ids()
-        __temp_id = deepcopy(app_ids)
-        for appid in app_ids:
-            if int(appid) in processed_id_set:
-                __temp_id.remove(appid)
-        app_ids = [str(appid) for appid in __temp_id]
-        total_apps = len(app_ids)
-        logging.info(f"Found {total_apps} total apps on steam.")
+        app_ids = self.db.get_unprocessed_app_ids(app_ids)
+        self.total_apps = len(app_ids)
+        logging.info(f"Found {self.total_apps} total apps on steam.")
         logging.info(f"Resuming progress. Found {processed_in_db} apps in database.")
         shuffle(app_ids)
 
-        newly_processed_count = 0
+        self.newly_processed_count = 0
+        self.pbar = tqdm(total=self.total_apps, desc='Scraping', unit='app', smoothing=0.1)
         try:
-            for i, appid_str in enumerate(app_ids):
-                appid = int(appid_str)
-                if self.args.pre_filter:
-                    if appid in processed_id_set:
-                        self.show_progress_bar('Scraping', i + 1, total_apps, newly_processed_count)
-                        continue
-                self.show_progress_bar('Scraping', i + 1, total_apps, newly_processed_count)
-                if self.db.is_processed(appid):
-                    sys.stdout.write('.')
-                    sys.stdout.flush()
-                    continue
-
-                app_details = self.steam_api.get_app_details(appid_str)
-                sleep_time = CONFIG['scraper_settings']['sleep']
-                time.sleep(sleep_time/2.0)
-
-                if not app_details:
-                    self.db.mark_as_processed(appid, 'unavailable')
-                    self.db.commit()
-                    continue
-
-                app_type = app_details.get('type')
-                if app_type not in ['game', 'dlc']:
-                    self.db.mark_as_processed(appid, f"skipped type: {app_type}")
-                    continue
-
-                use_steamspy = CONFIG['scraper_settings']['use_steamspy']
-                spy_details = self.steam_api.get_steamspy_details(appid_str) if use_steamspy and app_type == 'game' else None
-                parsed_data = self._parse_app_data(app_details, spy_details)
-
-                self.db.add_app_and_relations(parsed_data)
-
-                self.db.commit()
-                if parsed_data.get('base_game_id'):
-                   self.db.add_pending_dlc_link(appid, parsed_data['base_game_id'])
-
-                # Add achievements and reviews if applicable
-                if app_type == "game":
-                    if parsed_data['main_dict']['achievements_count'] > 0:
-                        self.db.add_achievements(self.steam_api.get_achievements(appid_str))
-                        self.db.commit()
-                self.db.add_reviews(self.steam_api.get_reviews(appid_str), appid_str)
-
-                self.db.mark_as_processed(appid, 'success')
-                self.db.commit()
-                newly_processed_count += 1
-                time.sleep(sleep_time)
+            # Route console logging through tqdm so log lines don't break the bar
+            with logging_redirect_tqdm():
+                asyncio.run(self._scrape(app_ids))
         except (KeyboardInterrupt, SystemExit):
-            print("\n")
             logging.warning("Shutdown signal received...")
         except Exception:
-            print("\n")
             logging.error(f"An unexpected error occurred: {traceback.format_exc()}")
         finally:
-            # Resolve any pending DLC links and show final progress
+            # Let an in-flight write finish, then resolve any pending DLC links and close the progress bar
+            self._db_pool.shutdown(wait=True)
             self.db.resolve_pending_dlc_links()
-            self.show_progress_bar('Finished', total_apps, total_apps, newly_processed_count)
-            print("\n")
-            logging.info(f"Scrape session concluded. Processed {newly_processed_count} new apps.")
+            self.pbar.close()
+            logging.info(f"Scrape session concluded. Processed {self.newly_processed_count} new apps.")
             self.db.close()
 
+    # Fetch the Steam app list inside its own short-lived HTTP session
+    async def _fetch_app_list(self) -> List[str]:
+        async with self.steam_api:
+            return await self.steam_api.get_all_app_ids()
+
+    # Fetch apps concurrently and hand the results to a single database writer
+    async def _scrape(self, app_ids: List[str]):
+        queue: asyncio.Queue = asyncio.Queue()
+        async with self.steam_api:
+            fetcher = asyncio.create_task(self._fetch_all(app_ids, queue))
+            writer = asyncio.create_task(self._write_results(queue))
+            done, pending = await asyncio.wait({fetcher, writer}, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()
+
+    # Run a bounded pool of workers over the app IDs, then signal the writer to stop
+    async def _fetch_all(self, app_ids: List[str], queue: asyncio.Queue):
+        app_iter = iter(app_ids)
+
+        async def worker():
+            # Workers share one iterator, which caps in-flight apps at the worker count
+            for appid_str in app_iter:
+                await queue.put(await self.fetch_app(appid_str))
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(CONFIG['scraper_settings']['concurrency'])))
+        finally:
+            queue.put_nowait(None)
+
+    # Fetch everything needed for one app; returns a result for the database writer
+    async def fetch_app(self, appid_str: str) -> Dict[str, Any]:
+        appid = int(appid_str)
+        try:
+            app_details = await self.steam_api.get_app_details(appid_str)
+        except FETCH_ERRORS as e:
+            return self._fetch_error(appid, e)
+        if not app_details:
+            return {'appid': appid, 'status': 'unavailable'}
+
+        app_type = app_details.get('type')
+        if app_type not in ['game', 'dlc']:
+            return {'appid': appid, 'status': f"skipped type: {app_type}", 'app_type': app_type}
+
+        is_game = app_type == 'game'
+        use_steamspy = CONFIG['scraper_settings']['use_steamspy'] and is_game
+        has_achievements = is_game and app_details.get('achievements', {}).get('total', 0) > 0
+        # Everything below depends only on the app details, so request it all at once
+        spy_details, achievements, reviews = await asyncio.gather(
+            self.steam_api.get_steamspy_details(appid_str) if use_steamspy else asyncio.sleep(0, result=None),
+            self.steam_api.get_achievements(appid_str) if has_achievements else asyncio.sleep(0, result=[]),
+            self.steam_api.get_reviews(appid_str), return_exceptions=True)
+        for outcome in (spy_details, achievements, reviews):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, FETCH_ERRORS):
+                raise outcome
+        # SteamSpy only adds optional fields, so the app is still stored without them
+        if isinstance(spy_details, BaseException):
+            logging.warning(f"SteamSpy details for app {appid} unavailable, storing without them: {spy_details!r}")
+            spy_details = None
+        for outcome in (achievements, reviews):
+            if isinstance(outcome, BaseException):
+                return self._fetch_error(appid, outcome, app_type)
+        return {'appid': appid, 'status': 'success', 'app_type': app_type,
+            'parsed_data': self._parse_app_data(app_details, spy_details),
+            'achievements': achievements, 'reviews': reviews}
+
+    # Result for an app whose requests still failed after every retry; the distinct status keeps it apart from
+    # 'unavailable' apps, lets one persistently failing app be recorded instead of stopping the whole run, and
+    # puts it back in the queue of the next run
+    @staticmethod
+    def _fetch_error(appid: int, error: BaseException, app_type: Optional[str] = None) -> Dict[str, Any]:
+        reason = error.status if isinstance(error, aiohttp.ClientResponseError) else type(error).__name__
+        logging.error(f"Giving up on app {appid}: {error!r}")
+        return {'appid': appid, 'status': f"error: {reason}"[:50], 'app_type': app_type}
+
+    # Consume fetched apps from the queue and write them to the database
+    async def _write_results(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while (result := await queue.get()) is not None:
+            # MySQLdb releases the GIL while waiting on the server, so writes and flushes overlap the HTTP fetches
+            await loop.run_in_executor(self._db_pool, self._store_app, result)
+            self.pbar.set_postfix(new=self.newly_processed_count, refresh=False)
+            self.pbar.update(1)
+
+    # Write a single fetched app and its relations, then mark it as processed
+    def _store_app(self, result: Dict[str, Any]):
+        appid, status, app_type = result['appid'], result['status'], result.get('app_type')
+        if status != 'success':
+            self.db.mark_as_processed(appid, status, app_type)
+            return
+
+        parsed_data = result['parsed_data']
+        self.db.add_app_and_relations(parsed_data)
+        if parsed_data.get('base_game_id'):
+           self.db.add_pending_dlc_link(appid, parsed_data['base_game_id'])
+
+        # Add achievements and reviews if applicable
+        if result['achievements']:
+            self.db.add_achievements(result['achievements'])
+        self.db.add_reviews(result['reviews'], str(appid))
+
+        # Rows are buffered; DatabaseManager commits them every batch_size apps
+        self.db.mark_as_processed(appid, 'success', app_type)
+        self.newly_processed_count += 1
+
     # Set up command-line argument parser
     def _setup_arg_parser(self) -> argparse.Namespace:
         parser = argparse.ArgumentParser(description=f'Steam Scraper {__version__}',
@@ -478,79 +779,59 @@ class SteamScraperApplication:
         parser.add_argument('--drop-tables', action='store_true',
             help='Drop all scraper tables from the database and exit.')
         parser.add_argument('--pre-filter', action='store_true',
-            help='Pre-filter which are already processed')
+            help='No-op, kept for compatibility: already processed apps are always filtered out')
         return parser.parse_args()
 
     # Parse app details and SteamSpy details into a structured dict for DB insertion
     def _parse_app_data(self, app_details: dict, spy_details: Optional[dict]) -> dict:
-        appid = app_details['steam_appid']
+        sanitize = SteamScraperApplication.sanitize_text
         app_type = app_details.get('type')
-        main_data = {
-            'id': appid, 'type': app_details.get('type'), 'name': SteamScraperApplication.sanitize_text(app_details.get('name')),
-            'base_game_id': app_details.get('fullgame', {}).get('appid'),
-            'release_date': self.parse_steam_date(app_details.get('release_date', {}).get('date', '')),
-            'price': 0.0, 'positive_reviews': 0, 'negative_reviews': 0, 'recommendations': 0, 'peak_ccu': 0,
-            'metacritic_score': 0, 'metacritic_url': None, 'required_age': 0, 'achievements_count': 0,
-            'supports_windows': False, 'supports_mac': False, 'supports_linux': False,
-            'header_image_url': app_details.get('header_image'), 'estimated_owners': None, 'user_score': 0, 'score_rank': None,
-            'about_the_game': SteamScraperApplication.sanitize_text(app_details.get('about_the_game')),
-            'detailed_description': SteamScraperApplication.sanitize_text(app_details.get('detailed_description')),
-            'short_description': SteamScraperApplication.sanitize_text(app_details.get('short_description')),
-            'reviews_summary': SteamScraperApplication.sanitize_text(app_details.get('reviews'))
-        }
-        if 'price_overview' in app_details:
-            main_data['price'] = self.price_to_float(
-            app_details['price_overview'].get('final_formatted', ''))
-        if 'recommendations' in app_details:
-            main_data['recommendations'] = app_details['recommendations'].get('total', 0)
-        if 'metacritic' in app_details:
-            main_data['metacritic_score'] = app_details['metacritic'].get('score', 0)
-            main_data['metacritic_url'] = app_details['metacritic'].get('url')
-        if 'platforms' in app_details:
-            main_data.update({
-                'supports_windows': app_details['platforms'].get('windows', False),
-                'supports_mac': app_details['platforms'].get('mac', False),
-                'supports_linux': app_details['platforms'].get('linux', False)
-            })
-
-        if app_type == "game":
-            main_data['required_age'] = int(str(app_details.get('required_age', '0')).replace('+', ''))
-            if 'achievements' in app_details:
-                main_data['achievements_count'] = app_details['achievements'].get('total', 0)
-
-            if spy_details:
-                main_data.update({
-                    'positive_reviews': spy_details.get('positive', 0), 'negative_reviews': spy_details.get('negative', 0),
-                    'peak_ccu': spy_details.get('ccu', 0), 'estimated_owners': spy_details.get('owners', '0 - 20000').replace(',', ''),
-                    'user_score': spy_details.get('userscore', 0), 'score_rank': spy_details.get('score_rank', '')
-                })
+        is_game = app_type == "game"
+        # Read each nested object once; absent ones fall back to empty dicts
+        price_overview = app_details.get('price_overview') or {}
+        metacritic = app_details.get('metacritic') or {}
+        platforms = app_details.get('platforms') or {}
+        base_game_id = (app_details.get('fullgame') or {}).get('appid')
+
+        # SteamSpy figures are only kept for games
+        if is_game and spy_details:
+            positive_reviews, negative_reviews = spy_details.get('positive', 0), spy_details.get('negative', 0)
+            peak_ccu, user_score = spy_details.get('ccu', 0), spy_details.get('userscore', 0)
+            estimated_owners = spy_details.get('owners', '0 - 20000').replace(',', '')
+            score_rank = spy_details.get('score_rank', '')
+        else:
+            positive_reviews = negative_reviews = peak_ccu = user_score = 0
+            estimated_owners = score_rank = None
+
+        # Same column order as the apps insert_update query
+        main_data_tuple = (
+            app_details['steam_appid'], app_type, sanitize(app_details.get('name')),
+            self.parse_steam_date((app_details.get('release_date') or {}).get('date', '')),
+            self.price_to_float(price_overview.get('final_formatted', '')) if price_overview else 0.0,
+            positive_reviews, negative_reviews,
+            (app_details.get('recommendations') or {}).get('total', 0), peak_ccu,
+            metacritic.get('score', 0), metacritic.get('url'),
+            int(str(app_details.get('required_age', '0')).replace('+', '')) if is_game else 0,
+            (app_details.get('achievements') or {}).get('total', 0) if is_game else 0,
+            platforms.get('windows', False), platforms.get('mac', False), platforms.get('linux', False),
+            app_details.get('header_image'), estimated_owners, user_score, score_rank,
+            sanitize(app_details.get('about_the_game')), sanitize(app_details.get('detailed_description')),
+            sanitize(app_details.get('short_description')), sanitize(app_details.get('reviews'))
+        )
 
         # Parse supported languages and full audio languages
         supported_languages, full_audio_languages = [], []
-        langs = [lang.strip()
-            for lang in SteamScraperApplication.sanitize_text(
-                app_details.get("supported_languages", "")).split(',') if lang.strip()]
-        for lang in langs:
+        for lang in sanitize(app_details.get("supported_languages", "")).split(','):
+            lang = lang.strip()
             clean_lang = lang.replace('*', '').strip()
             if clean_lang:
                 supported_languages.append(clean_lang)
                 if lang.endswith('*'):
                     full_audio_languages.append(clean_lang)
-        main_data_tuple = (
-                    main_data['id'], main_data['type'], main_data['name'],
-                    main_data['release_date'], main_data['price'], main_data['positive_reviews'],
-                    main_data['negative_reviews'], main_data['recommendations'], main_data['peak_ccu'],
-                    main_data['metacritic_score'], main_data['metacritic_url'], main_data['required_age'],
-                    main_data['achievements_count'], main_data['supports_windows'], main_data['supports_mac'],
-                    main_data['supports_linux'], main_data['header_image_url'], main_data['estimated_owners'],
-                    main_data['user_score'], main_data['score_rank'], main_data['about_the_game'],
-                    main_data['detailed_description'], main_data['short_description'], main_data['reviews_summary']
-                )
 
         return {
             'main_tuple': main_data_tuple,  # Use this tuple for the main INSERT operation.
-            'main_dict': main_data,       # Keep the dict for easy access to values by name (like 'name' for IGDB).
-            'base_game_id': app_details.get('fullgame', {}).get('appid'),
+            'base_game_id': base_game_id,
             'developers': app_details.get('developers', []), 'publishers': app_details.get('publishers', []),
             'categories': [c['description'] for c in app_details.get('categories', [])],
             'genres': [g['description'] for g in app_details.get('genres', [])],
@@ -563,40 +844,36 @@ class SteamScraperApplication:
         # Remove HTML tags and escape sequences from text
         if not text:
             return ''
-        text = str(text).replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-        return re.sub(r'<[^>]*>', ' ', text).replace('&quot;', '"').replace('&amp;', '&').strip()
+        text = str(text).translate(WHITESPACE_TABLE)
+        # Most strings (review bodies in particular) carry no tags or entities, so skip both passes
+        if '<' not in text and '&' not in text:
+            return text.strip()
+        return html.unescape(TAG_RE.sub(' ', text)).strip()
 
     @staticmethod
     def parse_steam_date(date_str: str):
         # Parse Steam date string to YYYY-MM-DD format
         if not date_str or 'coming_soon' in date_str:
             return None
-        cleaned_date = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_str.replace(',', ''))
+        match = STEAM_DATE_RE.match(ORDINAL_RE.sub(r'\1', date_str.replace(',', '')))
+        if not match:
+            return None
+        day_first, month_second, month_first, day_second, year = match.groups()
+        month = MONTHS.get((month_second or month_first).title())
+        if not month:
+            return None
         try:
-            return dt.datetime.strptime(cleaned_date, '%d %b %Y').strftime('%Y-%m-%d')
+            return dt.date(int(year), month, int(day_first or day_second)).isoformat()
         except ValueError:
-            try:
-                return dt.datetime.strptime(cleaned_date, '%b %d %Y').strftime('%Y-%m-%d')
-            except ValueError:
-                return None
-
-    @staticmethod
-    def show_progress_bar(title: str, count: int, total: int, new_items: int):
-        """Displays a dynamic progress bar in the console."""
-        bar_len = 60
-        filled_len = int(round(bar_len * count / float(total)))
-        percents = round(100.0 * count / float(total), 2)
-        bar = '█' * filled_len + '░' * (bar_len - filled_len)
-        now_time = dt.datetime.now(dt.timezone.utc).astimezone().strftime('%H:%M:%S')
-        sys.stdout.write(f"\r[I {now_time}] {title} {bar} {percents}% ({count}/{total}) | New This Session: {new_items}")
-        sys.stdout.flush()
+            # Day out of range for the month
+            return None
 
     @staticmethod
     def price_to_float(price_text: str) -> float:
         # Convert price string to float
         try:
             price_text = price_text.replace(',', '.')
-            match = re.search(r'([0-9]+\.?[0-9]*)', price_text)
+            match = PRICE_RE.search(price_text)
             return float(match.group(1)) if match else 0.0
         except (ValueError, AttributeError):
             return 0.0
@@ -0,0 +1,131 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(REPO_DIR, 'schema.yaml')
+sys.path.insert(0, REPO_DIR)
+
+import MySQLdb
+
+# Importing scraper archives old scraper_log_*.log files and opens a new one in the working directory,
+# so import it from a scratch directory to leave the developer's tree alone
+SCRATCH_DIR = tempfile.mkdtemp(prefix='scraper_tests_')
+_cwd = os.getcwd()
+os.chdir(SCRATCH_DIR)
+try:
+    import scraper
+finally:
+    os.chdir(_cwd)
+
+
+class FlushTest(unittest.TestCase):
+    """
+    Exercises DatabaseManager.flush against a mocked MySQLdb connection.
+    """
+    def setUp(self):
+        self.cursor = mock.MagicMock()
+        self.cursor.fetchall.return_value = []
+        self.cursor.execute.side_effect = self._execute
+        self.connection = connection = mock.MagicMock()
+        connection.cursor.return_value = self.cursor
+        self.load_error = None
+        self.load_paths = []
+        self.loaded_files = {}
+        creds = {'host': 'localhost', 'user': 'user', 'password': 'password', 'database': 'steam'}
+        # Keep the parsed-schema pickle out of the repository as well
+        with mock.patch.object(scraper.MySQLdb, 'connect', return_value=connection), \
+                mock.patch.object(scraper, 'YAML_CACHE_DIR', os.path.join(SCRATCH_DIR, '.yaml_cache')):
+            self.db = scraper.DatabaseManager(creds, schema_yaml_path=SCHEMA_PATH, batch_size=50,
+                bulk_load_min_rows=3)
+        self.cursor.reset_mock()
+        connection.reset_mock()
+
+    # Record the file each LOAD DATA reads, failing the load if the test asks for it
+    def _execute(self, sql, params=None):
+        if sql.lstrip().startswith('LOAD DATA'):
+            self.load_paths.append(params[0])
+            if self.load_error:
+                raise self.load_error
+            with open(params[0], encoding='utf-8') as f:
+                self.loaded_files[params[0]] = f.read()
+
+    def _executed_sql(self):
+        return [c.args[0] for c in self.cursor.execute.call_args_list]
+
+    def _achievement_rows(self, count):
+        return [{'app_id': 10, 'api_name': f"ACH_{i}", 'display_name': f"Tab\there {i}",
+            'description': None, 'global_completion_rate': 12.5} for i in range(count)]
+
+    def test_large_batch_is_loaded_through_staging_table(self):
+        self.db.add_achievements(self._achievement_rows(3))
+        self.db.flush()
+
+        executed = self._executed_sql()
+        self.assertTrue(any(sql.startswith('CREATE TEMPORARY TABLE IF NOT EXISTS _stage_achievements')
+            for sql in executed))
+        self.assertTrue(any(sql.startswith('INSERT INTO achievements') and 'SELECT' in sql
+            and 'FROM _stage_achievements ON DUPLICATE KEY UPDATE' in sql for sql in executed))
+        self.cursor.executemany.assert_not_called()
+        (path, content), = self.loaded_files.items()
+        self.assertEqual(content.splitlines()[0], "10\tACH_0\tTab\\there 0\t\\N\t12.5")
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(self.db._bulk_load_enabled)
+
+    def test_failed_load_falls_back_to_inserts(self):
+        self.load_error = MySQLdb.OperationalError(1148, 'The used command is not allowed with this MySQL version')
+        self.db.add_achievements(self._achievement_rows(3))
+        self.db.flush()
+
+        self.cursor.executemany.assert_called_once()
+        sql, rows = self.cursor.executemany.call_args.args
+        self.assertEqual(sql, self.db._insert_sql['achievements'])
+        self.assertEqual(len(rows), 3)
+        self.assertFalse(self.db._bulk_load_enabled)
+        self.assertFalse(any(os.path.exists(path) for path in self.load_paths))
+
+        # Later batches go straight to INSERTs
+        self.cursor.reset_mock()
+        self.db.add_achievements(self._achievement_rows(3))
+        self.db.flush()
+        self.assertFalse(any(sql.lstrip().startswith('LOAD DATA') for sql in self._executed_sql()))
+        self.cursor.executemany.assert_called_once()
+
+    def test_small_batch_uses_inserts(self):
+        self.db.add_achievements(self._achievement_rows(2))
+        self.db.flush()
+
+        self.assertEqual(self.loaded_files, {})
+        self.cursor.executemany.assert_called_once()
+
+    def test_failed_batch_is_rolled_back_and_not_written_again(self):
+        self.db._lookup_cache['developers']['Valve'] = 5
+        self.db.add_reviews([{'recommendationid': '1', 'author': {'steamid': '7'}, 'language': 'english',
+            'review': 'Fine', 'voted_up': True, 'votes_up': 0, 'votes_funny': 0, 'timestamp_created': 0}], '10')
+        self.db.mark_as_processed(10, 'success', 'game')
+        reviews_sql = self.db._insert_sql['reviews']
+
+        def executemany(sql, rows):
+            if sql == reviews_sql:
+                raise MySQLdb.OperationalError(2013, 'Lost connection to MySQL server during query')
+        self.cursor.executemany.side_effect = executemany
+
+        with self.assertRaises(MySQLdb.OperationalError):
+            self.db.flush()
+        self.connection.rollback.assert_called_once()
+        self.connection.commit.assert_not_called()
+        # The rolled-back batch may have inserted lookup names, so the cache is reloaded
+        self.assertNotIn('Valve', self.db._lookup_cache['developers'])
+
+        # Shutting down must not write what is left of the batch, e.g. its scrape_status rows
+        self.cursor.reset_mock()
+        self.db.resolve_pending_dlc_links()
+        self.db.close()
+        self.cursor.executemany.assert_not_called()
+        self.connection.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()